@@ -16,7 +16,33 @@ Usage Example (Backend):
     print(result['explanation']) # Human-readable reasons
 """
 
-from Integration.hybrid_analyzer import HybridAnalyzer
+import logging
+import threading
+
+# NOTE: Integration.hybrid_analyzer (torch + transformers) is imported lazily
+# in ReviewAnalyzer.__init__ so that importing this module stays cheap.
+
+logger = logging.getLogger(__name__)
+
+# Pre-built validation errors (copied per call so callers can't mutate them)
+_ERR_TYPE = {
+    'success': False,
+    'error': 'Review text must be a string',
+    'prediction': None,
+    'confidence': None,
+    'explanation': None
+}
+_ERR_EMPTY = {
+    'success': False,
+    'error': 'Review text cannot be empty',
+    'prediction': None,
+    'confidence': None,
+    'explanation': None
+}
+
+# One HybridAnalyzer per process, shared by every ReviewAnalyzer instance
+_ANALYZER_SINGLETON = None
+_SINGLETON_LOCK = threading.Lock()
 
 
 class ReviewAnalyzer:
@@ -34,17 +60,30 @@ class ReviewAnalyzer:
         return jsonify(result)
     """
     
+    # Only holds the shared HybridAnalyzer
+    __slots__ = ('_analyzer',)
+    
     def __init__(self):
         """
         Initialize the review analyzer.
         
         Loads DistilBERT and XAI engine automatically.
-        This happens once when the server starts.
+        The model is loaded once per process - creating more
+        ReviewAnalyzer objects reuses the same loaded model.
         """
+        global _ANALYZER_SINGLETON
+        
+        with _SINGLETON_LOCK:
+            if _ANALYZER_SINGLETON is None:
+                # Heavy import (torch + transformers) deferred until a model is needed
+                from Integration.hybrid_analyzer import HybridAnalyzer
+                
+                logger.info("Initializing Review Analyzer...")
+                _ANALYZER_SINGLETON = HybridAnalyzer()
+            
+            self._analyzer = _ANALYZER_SINGLETON
         
-        print("Initializing Review Analyzer...")
-        self._analyzer = HybridAnalyzer()
-        print("Review Analyzer ready for predictions")
+        logger.info("Review Analyzer ready for predictions")
     
     
     def predict(self, review_text):
@@ -79,67 +118,132 @@ class ReviewAnalyzer:
                 print(f"Confidence: {result['confidence']:.0%}")
                 print(f"Why: {result['explanation']}")
         """
-        # Validate input
-        if not review_text:
-            return {
-                'success': False,
-                'error': 'Review text cannot be empty',
-                'prediction': None,
-                'confidence': None,
-                'explanation': None
-            }
-        
-        if not isinstance(review_text, str):
-            return {
-                'success': False,
-                'error': 'Review text must be a string',
-                'prediction': None,
-                'confidence': None,
-                'explanation': None
-            }
-        
-        # Strip whitespace
-        review_text = review_text.strip()
-        
-        if len(review_text) == 0:
-            return {
-                'success': False,
-                'error': 'Review text cannot be empty or whitespace only',
-                'prediction': None,
-                'confidence': None,
-                'explanation': None
-            }
+        # Validate input and strip whitespace
+        review_text, error_response = self._clean(review_text)
+        if error_response:
+            return error_response
         
         try:
             # Get analysis from hybrid analyzer
             analysis = self._analyzer.analyze(review_text)
             
-            # Format explanation into single readable string
-            explanation_text = self._format_explanation(analysis)
-            
             # Return clean, JSON-ready response
-            return {
-                'success': True,
-                'prediction': analysis['prediction'],
-                'confidence': round(analysis['confidence'], 4),
-                'explanation': explanation_text,
-                'details': {
-                    'model_verdict': analysis['prediction'],
-                    'xai_verdict': analysis['explanation']['verdict'],
-                    'flags': analysis['explanation']['flag_count'],
-                    'agreement': analysis['agreement']
-                }
-            }
+            return self._success_response(analysis)
             
         except Exception as e:
             # Handle any errors 
-            return {
-                'success': False,
-                'error': f'Analysis failed: {str(e)}',
-                'prediction': None,
-                'confidence': None,
-                'explanation': None
+            return self._error_response(f'Analysis failed: {str(e)}')
+    
+    
+    def predict_batch(self, review_texts, batch_size=32):
+        """
+        Analyze many reviews in one call.
+        
+        DistilBERT runs on length-bucketed batches instead of one review
+        at a time, which is much faster when several reviews arrive together.
+        
+        Args:
+            review_texts (list): Review texts to analyze
+            batch_size (int): Maximum number of reviews per model forward pass
+            
+        Returns:
+            list: One predict()-style dict per review, in input order.
+                  Invalid reviews get success=False without failing the batch.
+            
+        Example:
+            results = analyzer.predict_batch(["Great product!", "Broke in a week."])
+            
+            for result in results:
+                if result['success']:
+                    print(result['prediction'])
+        """
+        results = [None] * len(review_texts)
+        valid_indices = []
+        valid_texts = []
+        
+        for i, review_text in enumerate(review_texts):
+            review_text, error_response = self._clean(review_text)
+            if error_response:
+                results[i] = error_response
+            else:
+                valid_indices.append(i)
+                valid_texts.append(review_text)
+        
+        if not valid_texts:
+            return results
+        
+        try:
+            analyses = self._analyzer.analyze_batch(valid_texts, batch_size=batch_size)
+        except Exception as e:
+            for i in valid_indices:
+                results[i] = self._error_response(f'Analysis failed: {str(e)}')
+            return results
+        
+        for i, analysis in zip(valid_indices, analyses):
+            results[i] = self._success_response(analysis)
+        
+        return results
+    
+    
+    def _clean(self, review_text):
+        """
+        Validate review text and strip surrounding whitespace.
+        
+        Internal method - backend doesn't call this directly.
+        Type is checked first, so e.g. 0 or [] report "must be a string".
+        
+        Args:
+            review_text: Raw input from the backend
+            
+        Returns:
+            tuple: (stripped text, None) if valid, else (None, error response)
+        """
+        if not isinstance(review_text, str):
+            return None, dict(_ERR_TYPE)
+        
+        review_text = review_text.strip()
+        if not review_text:
+            return None, dict(_ERR_EMPTY)
+        
+        return review_text, None
+    
+    
+    def _error_response(self, error):
+        """
+        Build the standard failure response.
+        
+        Internal method - backend doesn't call this directly.
+        """
+        return {
+            'success': False,
+            'error': error,
+            'prediction': None,
+            'confidence': None,
+            'explanation': None
+        }
+    
+    
+    def _success_response(self, analysis):
+        """
+        Build the JSON-ready success response from a hybrid analysis.
+        
+        Internal method - backend doesn't call this directly.
+        """
+        # Format explanation into single readable string
+        explanation_text = self._format_explanation(analysis)
+        
+        return {
+            'success': True,
+            'prediction': analysis['prediction'],
+            'confidence': round(analysis['confidence'], 4),
+            'explanation': explanation_text,
+            'details': {
+                'model_verdict': analysis['prediction'],
+                'xai_verdict': analysis['explanation']['verdict'],
+                'flags': analysis['explanation']['flag_count'],
+                'agreement': analysis['agreement']
             }
+        }
     
     
     def _format_explanation(self, analysis):
@@ -159,29 +263,24 @@ class ReviewAnalyzer:
         if not reasons:
             return "No suspicious patterns detected."
         
-        # Build explanation string
-        explanation_parts = []
-        
-        for reason in reasons:
-            # Skip the "Overall" reason (for genuine reviews)
-            if reason['feature'] == 'Overall':
-                continue
-            
-            # Format: "Feature: message"
-            explanation_parts.append(f"{reason['feature']}: {reason['detail']}")
-        
-        if not explanation_parts:
-            return "No suspicious patterns detected."
+        # Format: "Feature: detail", joined with semicolons
+        # (skip the "Overall" reason used for genuine reviews)
+        explanation = "; ".join(
+            f"{reason['feature']}: {reason['detail']}"
+            for reason in reasons
+            if reason['feature'] != 'Overall'
+        )
         
-        # Join with semicolons
-        return "; ".join(explanation_parts)
+        return explanation or "No suspicious patterns detected."
     
     
-    def get_model_info(self):
+    @classmethod
+    def get_model_info(cls):
         """
         Get information about the loaded model.
         
         Useful for API /info or /health endpoints.
+        Works without loading the model: ReviewAnalyzer.get_model_info()
         
         Returns:
             dict: {
@@ -230,13 +329,15 @@ class ReviewAnalyzer:
         """
         Quick health check to verify analyzer is working.
         
-        Useful for API /health endpoints.
+        Useful for API /health endpoints (e.g. frequent liveness probes).
+        Does NOT run the model - it checks the startup warm-up succeeded.
+        Use deep_health_check() for an end-to-end prediction test.
         
         Returns:
             dict: {
                 'status': 'healthy' or 'unhealthy',
                 'model_loaded': bool,
-                'test_prediction': dict (if healthy)
+                'device': str
             }
             
         Example:
@@ -244,9 +345,33 @@ class ReviewAnalyzer:
             def health():
                 return jsonify(analyzer.health_check())
         """
+        model_loaded = getattr(self._analyzer, '_warmed', False)
+        
+        return {
+            'status': 'healthy' if model_loaded else 'unhealthy',
+            'model_loaded': model_loaded,
+            'device': self._analyzer.device_name
+        }
+    
+    
+    def deep_health_check(self):
+        """
+        Full health check that runs a real prediction.
+        
+        Slower than health_check() - use for infrequent readiness probes.
+        
+        Returns:
+            dict: {
+                'status': 'healthy' or 'unhealthy',
+                'model_loaded': bool,
+                'test_prediction': bool (if healthy)
+            }
+        """
         try:
-            # Try a simple prediction
-            test_result = self.predict("Test review")
+            # Try a simple prediction - bypassing the result cache, so every
+            # probe really runs DistilBERT and the XAI engine
+            analysis = self._analyzer.analyze("Test review", use_cache=False)
+            test_result = self._success_response(analysis)
             
             return {
                 'status': 'healthy',
@@ -264,6 +389,9 @@ class ReviewAnalyzer:
 # ============================================================================
 
 if __name__ == "__main__":
+    # Show model loading progress when run as a script
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     print("="*70)
     print("API INTERFACE - Usage Examples for Backend Team")
     print("="*70)
@@ -0,0 +1,87 @@
+"""
+export_onnx.py - Export DistilBERT to ONNX for the ONNX Runtime backend
+
+Produces:
+1. Model/model.onnx       (FP32 graph, opset 14, dynamic batch/sequence axes)
+2. Model/model.int8.onnx  (dynamic INT8 quantization of the weights)
+
+Usage:
+    python -m Integration.export_onnx
+
+    analyzer = HybridAnalyzer()                    # CPU: loads Model/model.onnx
+    analyzer = HybridAnalyzer(backend="onnx")      # loads Model/model.int8.onnx
+    analyzer = HybridAnalyzer(backend="tensorrt")  # loads Model/model.onnx
+    analyzer = HybridAnalyzer(backend="openvino")  # loads Model/model.onnx
+"""
+
+import argparse
+import os
+
+import torch
+from transformers import DistilBertTokenizerFast, DistilBertForSequenceClassification
+
+# <project>/Model - where HybridAnalyzer looks for exported models
+DEFAULT_OUTPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Model")
+
+
+def export_onnx(model_path="ARG33/DistilBERT-finetuned", output_dir=DEFAULT_OUTPUT_DIR, quantize=True):
+    """
+    Export the fine-tuned DistilBERT to ONNX and optionally quantize it.
+
+    Args:
+        model_path: Hugging Face model checkpoint
+        output_dir: Folder to write the .onnx files to
+        quantize: Also write an INT8 dynamically-quantized copy
+
+    Returns:
+        str: Path of the model the ONNX backend should load
+    """
+    tokenizer = DistilBertTokenizerFast.from_pretrained(model_path)
+    model = DistilBertForSequenceClassification.from_pretrained(model_path)
+    model.eval()
+
+    os.makedirs(output_dir, exist_ok=True)
+    fp32_path = os.path.join(output_dir, "model.onnx")
+
+    # Dummy input only fixes the graph structure - axes stay dynamic
+    dummy = tokenizer("This is a sample review", return_tensors="pt")
+
+    torch.onnx.export(
+        model,
+        (dummy['input_ids'], dummy['attention_mask']),
+        fp32_path,
+        input_names=['input_ids', 'attention_mask'],
+        output_names=['logits'],
+        dynamic_axes={
+            'input_ids': {0: 'batch', 1: 'sequence'},
+            'attention_mask': {0: 'batch', 1: 'sequence'},
+            'logits': {0: 'batch'}
+        },
+        opset_version=14,
+        # torch >= 2.9 defaults to the dynamo exporter - keep the TorchScript
+        # exporter the opset / dynamic_axes settings above were written for
+        dynamo=False
+    )
+    print(f"Exported FP32 model to {fp32_path}")
+
+    if not quantize:
+        return fp32_path
+
+    # Optional dependency - only needed for the ONNX backend
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+
+    int8_path = os.path.join(output_dir, "model.int8.onnx")
+    quantize_dynamic(fp32_path, int8_path, weight_type=QuantType.QInt8)
+    print(f"Exported INT8 model to {int8_path}")
+
+    return int8_path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export DistilBERT to ONNX")
+    parser.add_argument("--model-path", default="ARG33/DistilBERT-finetuned")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument("--no-quantize", action="store_true", help="Skip INT8 quantization")
+    args = parser.parse_args()
+
+    export_onnx(args.model_path, args.output_dir, quantize=not args.no_quantize)
@@ -13,10 +13,70 @@ Usage:
     print(result['explanation'])  # Human-readable reasons
 """
 
-from transformers import DistilBertTokenizer, DistilBertForSequenceClassification
+import copy
+import importlib.util
+import logging
+import math
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+from transformers import DistilBertTokenizerFast, DistilBertForSequenceClassification
 import torch
 from XAI_engine.xai_engine import FakeReviewXAI
 
+logger = logging.getLogger(__name__)
+
+# Number of distinct review texts whose tokenization is kept in memory
+TOKENIZE_CACHE_SIZE = 1024
+
+# Number of distinct review texts whose full analyze() result is kept
+ANALYZE_CACHE_SIZE = 1024
+
+# Exported models live in <project>/Model, whatever the working directory
+MODEL_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Model")
+
+# Exported model each non-torch backend loads by default
+DEFAULT_ONNX_PATHS = {
+    'onnx': os.path.join(MODEL_DIR, "model.int8.onnx"),  # INT8 for ONNX Runtime on CPU
+    'tensorrt': os.path.join(MODEL_DIR, "model.onnx"),   # FP32 graph, TensorRT builds FP16 engine
+    'openvino': os.path.join(MODEL_DIR, "model.onnx")
+}
+
+# FP32 export backend="auto" uses on CPU - INT8 is opt-in (backend="onnx")
+AUTO_ONNX_PATH = os.path.join(MODEL_DIR, "model.onnx")
+
+# Where TensorRT stores built engines between runs
+TENSORRT_CACHE_DIR = os.path.join(MODEL_DIR, "trt_cache")
+
+# Shape range the TensorRT engine is built for: batches up to the default
+# batch_size, sequences up to the tokenizer's max_length (opt = typical review)
+TENSORRT_MAX_BATCH = 32
+TENSORRT_PROFILE_SHAPES = {
+    'trt_profile_min_shapes': "input_ids:1x1,attention_mask:1x1",
+    'trt_profile_opt_shapes': f"input_ids:{TENSORRT_MAX_BATCH}x128,attention_mask:{TENSORRT_MAX_BATCH}x128",
+    'trt_profile_max_shapes': f"input_ids:{TENSORRT_MAX_BATCH}x512,attention_mask:{TENSORRT_MAX_BATCH}x512"
+}
+
+# Device names health_check() reports for each execution provider
+_PROVIDER_DEVICES = {
+    'TensorrtExecutionProvider': "cuda (TensorRT)",
+    'CUDAExecutionProvider': "cuda (ONNX Runtime)",
+    'CPUExecutionProvider': "cpu (ONNX Runtime)"
+}
+
+# Cores this process may run on (respects taskset / cgroup cpusets)
+AVAILABLE_CPUS = (len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity")
+                  else os.cpu_count() or 1)
+
+# Background threads for XAI explanations (run concurrently with DistilBERT)
+XAI_WORKERS = min(4, AVAILABLE_CPUS)
+
+# XAI verdicts that count as agreeing with a DistilBERT FAKE prediction
+_FAKE_VERDICTS = frozenset({'LIKELY FAKE', 'SUSPICIOUS'})
+
 
 class HybridAnalyzer:
     """
@@ -24,75 +84,387 @@ class HybridAnalyzer:
     
     Attributes:
         tokenizer: DistilBERT tokenizer
-        model: Fine-tuned DistilBERT model
+        model: Fine-tuned DistilBERT model (torch backend only)
+        session: ONNX Runtime session or OpenVINO compiled model
+                 (None when backend="torch")
+        backend: "torch", "onnx", "tensorrt" or "openvino"
         xai_engine: XAI engine for explanations
-        device: CPU or GPU
+        device: torch device (CPU or GPU); see device_name for the
+                device the active backend actually runs on
     """
     
-    def __init__(self, model_path="ARG33/DistilBERT-finetuned", xai_engine=None):
+    # Fixed attribute set: no per-instance __dict__, faster attribute access
+    __slots__ = (
+        'tokenizer', 'backend', 'model', 'session', 'device',
+        'id2label', 'label2prediction', 'xai_engine',
+        '_thread_state', '_encode_cached', '_analyze_cached', '_warmed', '_xai_executor'
+    )
+    
+    def __init__(self, model_path="ARG33/DistilBERT-finetuned", xai_engine=None,
+                 backend="auto", onnx_path=None, reduced_precision=True,
+                 compile_model=True, quantize_cpu=False):
         """
         Initialize the hybrid analyzer.
         
         Args:
             model_path: Hugging Face model checkpoint
             xai_engine: Optional pre-configured XAI engine
+            backend: "auto" (default), "torch", "onnx" (ONNX Runtime),
+                     "tensorrt" (ONNX Runtime + TensorRT, GPU) or
+                     "openvino" (OpenVINO, Intel CPU).
+                     "auto" picks ONNX Runtime with the FP32 export on
+                     CPU-only machines when it exists and onnxruntime is
+                     installed, else "torch". The INT8 model is opt-in via
+                     backend="onnx"
+            onnx_path: Exported model for the non-torch backends; defaults to
+                       DEFAULT_ONNX_PATHS[backend]
+                       (create it with: python -m Integration.export_onnx)
+            reduced_precision: torch backend on GPU only - FP16 weights
+            compile_model: torch backend only - torch.compile the forward
+                           to fuse pointwise kernels (default mode, no CUDA
+                           graphs; falls back to eager if compilation fails)
+            quantize_cpu: torch backend on CPU only - dynamic INT8 Linear
+                          layers. Off by default: activation scales are
+                          computed per batch (padding included), so batched
+                          confidences would depend on which reviews share a
+                          batch and drift from single-review results
         """
-        print("Loading DistilBERT model from Hugging Face Hub...")
+        if backend == "auto":
+            backend, onnx_path = self._auto_backend(onnx_path)
+        
+        if backend != "torch" and backend not in DEFAULT_ONNX_PATHS:
+            raise ValueError(
+                f"Unknown backend: {backend!r} "
+                f"(expected 'auto', 'torch', 'onnx', 'tensorrt' or 'openvino')"
+            )
+        
+        if onnx_path is None:
+            onnx_path = DEFAULT_ONNX_PATHS.get(backend)
         
-        # Load tokenizer and model from Hugging Face
-        self.tokenizer = DistilBertTokenizer.from_pretrained(model_path)
-        self.model = DistilBertForSequenceClassification.from_pretrained(model_path)
+        logger.info("Loading DistilBERT model from Hugging Face Hub...")
+        
+        # Load tokenizer from Hugging Face (shared by all backends)
+        self.tokenizer = DistilBertTokenizerFast.from_pretrained(model_path)
+        self.backend = backend
+        self.model = None
+        self.session = None
         
         # Set device (GPU if available)
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-        self.model.to(self.device)
-        self.model.eval()  # Set to evaluation mode
+        
+        if backend == "onnx":
+            self.session = self._load_onnx_session(onnx_path)
+        elif backend == "tensorrt":
+            self.session = self._load_onnx_session(onnx_path, tensorrt=True)
+        elif backend == "openvino":
+            self.session = self._load_openvino_model(onnx_path)
+        else:
+            if self.device.type == "cpu":
+                self._configure_cpu_threads()
+            
+            self.model = DistilBertForSequenceClassification.from_pretrained(model_path)
+            self.model.to(self.device)
+            self.model.eval()  # Set to evaluation mode
+            
+            if self.device.type == "cuda":
+                if reduced_precision:
+                    # FP16 halves weight bytes and uses Tensor Cores
+                    self.model.half()
+            elif quantize_cpu:
+                # INT8 weights for Linear layers (attention + FFN matmuls)
+                self.model = torch.quantization.quantize_dynamic(
+                    self.model, {torch.nn.Linear}, dtype=torch.qint8
+                )
         
         # Label mapping (from your training)
         self.id2label = {0: "CG", 1: "OR"}  # 0=Fake, 1=Genuine
         self.label2prediction = {"CG": "FAKE", "OR": "REAL"}
         
+        # Per-thread CUDA streams / OpenVINO infer requests
+        self._thread_state = threading.local()
+        
+        # Per-instance tokenization cache for single-review predictions
+        self._encode_cached = lru_cache(maxsize=TOKENIZE_CACHE_SIZE)(self._encode_single)
+        
+        # Per-instance cache of complete analyze() results (see clear_cache)
+        self._analyze_cached = lru_cache(maxsize=ANALYZE_CACHE_SIZE)(self._analyze_uncached)
+        
+        # Warm-up: one tiny forward pass at startup so the first real request
+        # doesn't pay lazy init costs, and health checks can skip inference
+        self._warmed = False
+        if compile_model and self.model is not None:
+            self._compile_and_warm_up()
+        else:
+            self._predict_logits(["Warm up review"])
+        self._warmed = True
+        
         # Initialize XAI engine
         self.xai_engine = xai_engine if xai_engine else FakeReviewXAI()
+        # Loads VADER / the POS tagger now rather than on the first request
+        self.xai_engine.analyze_review("Warm up review")
         
-        print(f"Model loaded on {self.device}")
-        print(f"XAI engine initialized")
+        # Runs XAI explanations alongside the DistilBERT forward pass
+        self._xai_executor = ThreadPoolExecutor(max_workers=XAI_WORKERS)
         
-    #================ DistilBERT Prediction Method =================#
-    def predict_distilbert(self, review_text):
+        logger.info("Model loaded on %s (%s backend)", self.device_name, self.backend)
+        logger.info("XAI engine initialized")
+    
+    @property
+    def device_name(self):
         """
-        Get DistilBERT prediction.
+        Where inference actually runs, e.g. "cuda", "cpu (ONNX Runtime)".
+        
+        self.device is only the torch device; the ONNX Runtime and OpenVINO
+        backends run wherever their provider / plugin places the model.
+        """
+        if self.backend == "torch":
+            return str(self.device)
+        if self.backend == "openvino":
+            return "cpu (OpenVINO)"
+        provider = self.session.get_providers()[0]
+        return _PROVIDER_DEVICES.get(provider, provider)
+    
+    @staticmethod
+    def _auto_backend(onnx_path):
+        """
+        Pick the fastest available backend without extra configuration.
+        
+        On CPU, ONNX Runtime with the FP32 export beats eager PyTorch; on GPU,
+        the FP16 torch path is used. The INT8 export is never picked here:
+        dynamic INT8 scales activations per batch, so batched confidences
+        would differ from single ones (same reason quantize_cpu is opt-in).
+        
+        Returns:
+            tuple: (backend, onnx_path)
+        """
+        onnx_path = onnx_path or AUTO_ONNX_PATH
+        
+        if (not torch.cuda.is_available()
+                and os.path.exists(onnx_path)
+                and importlib.util.find_spec("onnxruntime") is not None):
+            return "onnx", onnx_path
+        return "torch", None
+    
+    @staticmethod
+    def _configure_cpu_threads():
+        """
+        Fit torch's CPU thread pools to the cores this process may use.
+        
+        Torch thread pools are process-global, so this only ever lowers them:
+        a pool the caller already shrank (or fixed via OMP_NUM_THREADS) is
+        left alone. One core is kept for the XAI workers - they are pure
+        Python and share the GIL, so together they occupy about one core.
+        A single DistilBERT forward is a chain of ops, so inter-op threads
+        only compete with the intra-op pool.
+        """
+        if "OMP_NUM_THREADS" in os.environ:
+            return
+        
+        intra_op = max(1, AVAILABLE_CPUS - 1)
+        if torch.get_num_threads() > intra_op:
+            torch.set_num_threads(intra_op)
+        
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            # Only settable before the first parallel op (e.g. a second
+            # analyzer in the same process) - keep the existing pool
+            pass
+    
+    def _compile_and_warm_up(self):
+        """
+        Compile the model with torch.compile and trigger compilation with the
+        warm-up pass. Falls back to the eager model if compilation fails.
+        """
+        eager_model = self.model
+        # dynamic=True: review lengths vary, avoid one recompile per length
+        self.model = torch.compile(eager_model, dynamic=True)
+        
+        try:
+            self._predict_logits(["Warm up review"])
+        except Exception as e:
+            logger.warning("torch.compile failed (%s), using eager model", e)
+            self.model = eager_model
+            self._predict_logits(["Warm up review"])
+    
+    def _load_onnx_session(self, onnx_path, tensorrt=False):
+        """
+        Create an ONNX Runtime session with all graph optimizations enabled.
         
         Args:
-            review_text (str): Review to classify
+            onnx_path: Path to the exported (optionally INT8-quantized) model
+            tensorrt: Put TensorRT first so it builds a fused FP16 engine
+                      (cached on disk so it is only built once)
             
         Returns:
-            dict: {
-                'label': 'CG' or 'OR',
-                'prediction': 'FAKE' or 'REAL',
-                'confidence': 0.0-1.0,
-                'probabilities': [prob_fake, prob_real]
-            }
+            onnxruntime.InferenceSession
+        """
+        # Optional dependency - only needed for the ONNX/TensorRT backends
+        import onnxruntime as ort
+        
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = AVAILABLE_CPUS
+        
+        available = ort.get_available_providers()
+        providers = [p for p in ("CUDAExecutionProvider", "CPUExecutionProvider") if p in available]
+        
+        if tensorrt:
+            if "TensorrtExecutionProvider" not in available:
+                logger.warning("TensorrtExecutionProvider not available, falling back to %s", providers)
+            else:
+                # Explicit profile: one engine for every batch / length,
+                # instead of a rebuild whenever a new shape arrives
+                providers.insert(0, ("TensorrtExecutionProvider", {
+                    'trt_fp16_enable': True,
+                    'trt_engine_cache_enable': True,
+                    'trt_engine_cache_path': TENSORRT_CACHE_DIR,
+                    **TENSORRT_PROFILE_SHAPES
+                }))
+        
+        return ort.InferenceSession(onnx_path, sess_options=options, providers=providers)
+    
+    def _load_openvino_model(self, onnx_path):
+        """
+        Compile the exported ONNX model with OpenVINO for the CPU.
+        
+        Args:
+            onnx_path: Path to the exported FP32 model
+            
+        Returns:
+            openvino.CompiledModel
+        """
+        # Optional dependency - only needed for the OpenVINO backend
+        import openvino as ov
+        
+        return ov.Core().compile_model(onnx_path, "CPU", {"PERFORMANCE_HINT": "LATENCY"})
+    
+    def _encode(self, texts):
+        """
+        Tokenize a list of texts for the active backend.
+        
+        Args:
+            texts (list): Reviews to tokenize (padded together as one batch)
+            
+        Returns:
+            tuple: (input_ids, attention_mask) as CPU tensors / numpy arrays
         """
         # Tokenize (same as training - no preprocessing)
+        # A single sequence never needs padding, so skip that code path
         inputs = self.tokenizer(
-            review_text,
+            texts,
             truncation=True,
-            padding=True,
+            padding="longest" if len(texts) > 1 else False,
             max_length=512,
-            return_tensors="pt"
+            return_tensors="pt" if self.backend == "torch" else "np"
         )
+        input_ids, attention_mask = inputs['input_ids'], inputs['attention_mask']
+        
+        if self.device.type == "cuda" and self.backend == "torch":
+            # Pinned host memory allows asynchronous host-to-device copies
+            input_ids, attention_mask = input_ids.pin_memory(), attention_mask.pin_memory()
+        
+        return input_ids, attention_mask
+    
+    def _encode_single(self, text):
+        """
+        Tokenize one review. Wrapped in an LRU cache in __init__ because the
+        tokenizer is deterministic and duplicate reviews are common.
+        """
+        return self._encode([text])
+    
+    def _forward(self, input_ids, attention_mask):
+        """
+        Run the classifier on already-tokenized input.
+        
+        Returns:
+            list: [logit_fake, logit_real] for each row
+        """
+        if self.backend != "torch":
+            # DistilBERT takes no token_type_ids
+            inputs = {
+                'input_ids': input_ids.astype(np.int64),
+                'attention_mask': attention_mask.astype(np.int64)
+            }
+            
+            if self.backend == "openvino":
+                return self._openvino_request().infer(inputs)[0].tolist()
+            
+            return self.session.run(None, inputs)[0].tolist()
+        
+        if self.device.type != "cuda":
+            # inference_mode skips autograd version/view tracking entirely
+            with torch.inference_mode():
+                logits = self.model(input_ids=input_ids, attention_mask=attention_mask).logits
+            
+            return logits.float().tolist()
+        
+        # GPU: each thread issues work on its own stream so concurrent
+        # requests can overlap copies and kernels
+        stream = self._cuda_stream()
+        # Order after work queued on the default stream (weight upload,
+        # half(), compile) - side streams don't sync with it implicitly
+        stream.wait_stream(torch.cuda.current_stream(self.device))
+        with torch.cuda.stream(stream), torch.inference_mode():
+            input_ids = input_ids.to(self.device, non_blocking=True)
+            attention_mask = attention_mask.to(self.device, non_blocking=True)
+            
+            # FP32 on the way out - the model may run in FP16
+            logits = self.model(input_ids=input_ids, attention_mask=attention_mask).logits.float()
+            
+            logits_host = torch.empty(logits.shape, dtype=logits.dtype, pin_memory=True)
+            logits_host.copy_(logits, non_blocking=True)
+        
+        # Wait only for this thread's stream before reading the result
+        stream.synchronize()
+        return logits_host.tolist()
+    
+    def _openvino_request(self):
+        """
+        Return the OpenVINO infer request owned by the calling thread.
+        """
+        request = getattr(self._thread_state, 'infer_request', None)
+        if request is None:
+            request = self.session.create_infer_request()
+            self._thread_state.infer_request = request
+        return request
+    
+    def _cuda_stream(self):
+        """
+        Return the CUDA stream owned by the calling thread.
+        """
+        stream = getattr(self._thread_state, 'stream', None)
+        if stream is None:
+            stream = torch.cuda.Stream(device=self.device)
+            self._thread_state.stream = stream
+        return stream
+    
+    def _predict_logits(self, texts):
+        """
+        Tokenize and classify a list of texts as one batch.
         
-        # Move to device
-        inputs = {key: val.to(self.device) for key, val in inputs.items()}
+        Args:
+            texts (list): Reviews to classify
+            
+        Returns:
+            list: [logit_fake, logit_real] for each text
+        """
+        return self._forward(*self._encode(texts))
+    
+    def _to_result(self, logits):
+        """
+        Map a [logit_fake, logit_real] pair to a prediction dict.
         
-        # Get prediction
-        with torch.no_grad():
-            outputs = self.model(**inputs)
-            logits = outputs.logits
-            probabilities = torch.softmax(logits, dim=1)
-            predicted_class = torch.argmax(probabilities, dim=1).item()
-            confidence = probabilities[0][predicted_class].item()
+        With only two classes, argmax and softmax are cheaper on the host in
+        plain Python than as extra tensor ops on the device.
+        """
+        max_logit = max(logits)
+        predicted_class = logits.index(max_logit)  # first max, like argmax
+        
+        # Numerically stable softmax
+        exps = [math.exp(logit - max_logit) for logit in logits]
+        total = sum(exps)
+        probabilities = [e / total for e in exps]
         
         # Map to labels
         label = self.id2label[predicted_class]
@@ -101,17 +473,71 @@ class HybridAnalyzer:
         return {
             'label': label,
             'prediction': prediction,
-            'confidence': confidence,
-            'probabilities': probabilities[0].cpu().tolist()
+            'confidence': probabilities[predicted_class],
+            'probabilities': probabilities
         }
+        
+    #================ DistilBERT Prediction Method =================#
+    def predict_distilbert(self, review_text):
+        """
+        Get DistilBERT prediction.
+        
+        Args:
+            review_text (str): Review to classify
+            
+        Returns:
+            dict: {
+                'label': 'CG' or 'OR',
+                'prediction': 'FAKE' or 'REAL',
+                'confidence': 0.0-1.0,
+                'probabilities': [prob_fake, prob_real]
+            }
+        """
+        logits = self._forward(*self._encode_cached(review_text))[0]
+        return self._to_result(logits)
+    
+    def predict_distilbert_batch(self, review_texts, batch_size=32):
+        """
+        Get DistilBERT predictions for many reviews at once.
+        
+        Reviews are sorted by length and split into batches so that each
+        batch is padded only to its own longest review, then results are
+        returned in the original order.
+        
+        Args:
+            review_texts (list): Reviews to classify
+            batch_size (int): Maximum number of reviews per forward pass
+            
+        Returns:
+            list: One predict_distilbert()-style dict per review
+        """
+        if self.backend == "tensorrt":
+            # Larger batches fall outside the engine's optimization profile
+            batch_size = min(batch_size, TENSORRT_MAX_BATCH)
+        
+        # Length-bucket: similar lengths end up in the same batch
+        order = sorted(range(len(review_texts)), key=lambda i: len(review_texts[i]))
+        results = [None] * len(review_texts)
+        to_result = self._to_result
+        
+        for start in range(0, len(order), batch_size):
+            batch_indices = order[start:start + batch_size]
+            batch_texts = [review_texts[i] for i in batch_indices]
+            
+            for idx, logits in zip(batch_indices, self._predict_logits(batch_texts)):
+                results[idx] = to_result(logits)
+        
+        return results
     
     #================ Hybrid Analysis Method =================#
-    def analyze(self, review_text):
+    def analyze(self, review_text, use_cache=True):
         """
         Complete analysis: DistilBERT prediction + XAI explanation.
         
         Args:
             review_text (str): Review to analyze
+            use_cache (bool): Serve repeated texts from the result cache;
+                              False always runs both models (health checks)
             
         Returns:
             dict: {
@@ -127,32 +553,106 @@ class HybridAnalyzer:
                 'agreement': bool  # Do DistilBERT and XAI agree?
             }
         """
-        # Step 1: Get DistilBERT prediction
+        if not use_cache:
+            return self._analyze_uncached(review_text)
+        
+        # Repeated reviews skip both models; callers get their own copy so
+        # mutating a result can't corrupt the cache
+        return copy.deepcopy(self._analyze_cached(review_text))
+    
+    def _analyze_uncached(self, review_text):
+        """Run DistilBERT and the XAI engine for one review (see analyze())."""
+        # Step 1: Start the XAI explanation in the background - it is pure
+        # Python, so it overlaps with the DistilBERT forward (native ops
+        # release the GIL)
+        xai_future = self._xai_executor.submit(self.xai_engine.analyze_review, review_text)
+        
+        # Step 2: Get DistilBERT prediction
         distilbert_result = self.predict_distilbert(review_text)
         
-        # Step 2: Get XAI explanation
-        xai_result = self.xai_engine.analyze_review(review_text)
+        return self._combine(review_text, distilbert_result, xai_future.result())
+    
+    def clear_cache(self):
+        """
+        Drop cached analyze() results and tokenizations.
         
+        Call after changing self.xai_engine.thresholds or swapping the POS
+        tagger with feature_extractors.set_pos_tagger(), so repeated reviews
+        are re-analyzed with the new settings (set_pos_tagger() already
+        clears the XAI feature cache, but not these results).
+        """
+        self._analyze_cached.cache_clear()
+        self._encode_cached.cache_clear()
+    
+    def analyze_batch(self, review_texts, batch_size=32):
+        """
+        Batched version of analyze().
+        
+        DistilBERT runs once per length-bucketed batch; the XAI engine
+        explains each chunk of batch_size reviews in one call, so POS
+        tagging is batched as well.
+        
+        Args:
+            review_texts (list): Reviews to analyze
+            batch_size (int): Maximum number of reviews per forward pass
+            
+        Returns:
+            list: One analyze()-style dict per review, in input order
+        """
+        review_texts = list(review_texts)
+        
+        # One XAI job per chunk - chunks run on the worker pool while the
+        # main thread drives DistilBERT
+        xai_futures = [
+            self._xai_executor.submit(
+                self.xai_engine.analyze_reviews, review_texts[start:start + batch_size]
+            )
+            for start in range(0, len(review_texts), batch_size)
+        ]
+        distilbert_results = self.predict_distilbert_batch(review_texts, batch_size=batch_size)
+        
+        xai_results = []
+        for xai_future in xai_futures:
+            xai_results.extend(xai_future.result())
+        
+        return [
+            self._combine(review_text, distilbert_result, xai_result)
+            for review_text, distilbert_result, xai_result
+            in zip(review_texts, distilbert_results, xai_results)
+        ]
+    
+    def _combine(self, review_text, distilbert_result, xai_result):
+        """
+        Merge a DistilBERT prediction with the XAI explanation for one review.
+        
+        Args:
+            review_text (str): Review that was classified
+            distilbert_result (dict): Result from predict_distilbert()
+            xai_result (dict): Result from FakeReviewXAI.analyze_review()
+            
+        Returns:
+            dict: Same structure as analyze()
+        """
         # Step 3: Check agreement
         # DistilBERT says FAKE → XAI should say LIKELY FAKE or SUSPICIOUS
         # DistilBERT says REAL → XAI should say LIKELY GENUINE
-        distilbert_says_fake = distilbert_result['prediction'] == 'FAKE'
-        xai_says_fake = xai_result['verdict'] in ['LIKELY FAKE', 'SUSPICIOUS']
-        agreement = (distilbert_says_fake == xai_says_fake)
+        prediction = distilbert_result['prediction']
+        verdict = xai_result['verdict']
+        agreement = ((prediction == 'FAKE') == (verdict in _FAKE_VERDICTS))
         
         # Step 4: Combine results
         return {
             'review_text': review_text,
             
             # Primary prediction (from DistilBERT - most accurate)
-            'prediction': distilbert_result['prediction'],
+            'prediction': prediction,
             'confidence': distilbert_result['confidence'],
             'model_label': distilbert_result['label'],
             'probabilities': distilbert_result['probabilities'],
             
             # Explanation (from XAI - most interpretable)
             'explanation': {
-                'verdict': xai_result['verdict'],
+                'verdict': verdict,
                 'xai_confidence': xai_result['confidence'],
                 'reasons': xai_result['reasons'],
                 'features': xai_result['features'],
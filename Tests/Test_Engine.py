@@ -266,6 +266,73 @@ def test_tier3_contribution():
     print("\n Test passed: Tier 3 features are being evaluated")
 
 
+def test_batch_analysis():
+    """Test that batch analysis matches single-review analysis"""
+    print("\n" + "="*60)
+    print("TEST 9: Batch Analysis")
+    print("="*60)
+    
+    xai = FakeReviewXAI()
+    reviews = [
+        "AMAZING!!! BEST PRODUCT EVER!!! I LOVE IT SO MUCH!!!",
+        "Bought this laptop 3 weeks ago for work. Battery lasts about 6 hours with normal use.",
+        "Great product! Works perfectly!"
+    ]
+    
+    batch_results = xai.analyze_reviews(reviews)
+    
+    assert len(batch_results) == len(reviews), \
+        f"Expected {len(reviews)} results, got {len(batch_results)}"
+    
+    for review, batch_result in zip(reviews, batch_results):
+        single_result = xai.analyze_review(review)
+        assert batch_result['review_text'] == review, "Batch results out of order"
+        assert batch_result['features'] == single_result['features'], \
+            f"Batch/single feature mismatch for: {review}"
+        assert batch_result['verdict'] == single_result['verdict'], \
+            f"Batch/single verdict mismatch for: {review}"
+        print(f"  {batch_result['verdict']}: {review[:40]}")
+    
+    print("\n Test passed: Batch analysis matches single analysis")
+
+
+def test_skip_tier3_short():
+    """Test that the opt-in short-review option skips only Tier 3"""
+    print("\n" + "="*60)
+    print("TEST 10: Skip Tier 3 For Short Reviews")
+    print("="*60)
+    
+    xai = FakeReviewXAI(skip_tier3_short=True)
+    short = xai.analyze_review("Best ever!!!")
+    long = xai.analyze_review(
+        "Bought this laptop 3 weeks ago for work. Battery lasts about 6 hours "
+        "with normal use. Keyboard is comfortable for typing."
+    )
+    
+    assert 'flesch_score' not in short['features'], "Short review should skip Tier 3"
+    assert 'caps_ratio' in short['features'], "Short review should keep Tier 2"
+    assert any(r['feature'] == 'Length' for r in short['reasons']), \
+        "Short review should still be flagged for length"
+    assert 'flesch_score' in long['features'], "Long review should get all tiers"
+    
+    # The batch path must make the same per-review tier choice
+    reviews = ["Love it", "Good product. I like it.", long['review_text']]
+    batch_results = xai.analyze_reviews(reviews)
+    for review, batch_result in zip(reviews, batch_results):
+        single_result = xai.analyze_review(review)
+        assert batch_result['features'] == single_result['features'], \
+            f"Batch/single feature mismatch for: {review}"
+        assert batch_result['verdict'] == single_result['verdict'], \
+            f"Batch/single verdict mismatch for: {review}"
+        assert batch_result['confidence'] == single_result['confidence'], \
+            f"Batch/single confidence mismatch for: {review}"
+    
+    print(f"  Short: {short['verdict']} ({len(short['features'])} features)")
+    print(f"  Long:  {long['verdict']} ({len(long['features'])} features)")
+    
+    print("\n Test passed: Fast short path works")
+
+
 # ============================================================================
 # RUN ALL TESTS
 # ============================================================================
@@ -283,7 +350,9 @@ if __name__ == "__main__":
         test_reason_generation,
         test_format_output,
         test_threshold_usage,
-        test_tier3_contribution
+        test_tier3_contribution,
+        test_batch_analysis,
+        test_skip_tier3_short
     ]
     
     passed = 0
@@ -208,6 +208,126 @@ def test_format_output():
     return True
 
 
+def test_batch_prediction():
+    """Test batched DistilBERT prediction matches single predictions"""
+    print("\n" + "="*70)
+    print("TEST 9: Batch Prediction")
+    print("="*70)
+    
+    reviews = [
+        "AMAZING!!! BEST PRODUCT EVER!!! I LOVE IT SO MUCH!!!",
+        "Good",
+        "Bought this laptop 3 weeks ago for work. Battery lasts about 6 hours with normal use.",
+        "This is a test review"
+    ]
+    batch_results = analyzer.predict_distilbert_batch(reviews, batch_size=2)
+    
+    assert len(batch_results) == len(reviews), \
+        f"Expected {len(reviews)} results, got {len(batch_results)}"
+    
+    # Results must come back in input order and agree with single predictions
+    for review, batch_result in zip(reviews, batch_results):
+        single_result = analyzer.predict_distilbert(review)
+        assert batch_result['prediction'] == single_result['prediction'], \
+            f"Batch/single mismatch for: {review}"
+        assert abs(batch_result['confidence'] - single_result['confidence']) < 1e-3, \
+            f"Confidence mismatch for: {review}"
+        print(f"  {batch_result['prediction']} ({batch_result['confidence']:.1%}): {review[:40]}")
+    
+    # Full hybrid batch keeps the analyze() structure
+    hybrid_results = analyzer.analyze_batch(reviews)
+    for review, result in zip(reviews, hybrid_results):
+        assert result['review_text'] == review, "Batch results out of order"
+        assert 'explanation' in result, "Missing explanation in batch result"
+    
+    print("\nTest passed: Batch prediction works correctly")
+    return True
+
+
+def test_cached_analysis():
+    """Test repeated analyze() calls return equal but independent results"""
+    print("\n" + "="*70)
+    print("TEST 10: Cached Analysis")
+    print("="*70)
+    
+    review = "Great product works well"
+    first = analyzer.analyze(review)
+    first['explanation']['reasons'].clear()  # must not leak into the cache
+    second = analyzer.analyze(review)
+    
+    assert second['prediction'] == first['prediction'], "Cached prediction changed"
+    assert len(second['explanation']['reasons']) > 0, \
+        "Mutating a result corrupted the cache"
+    
+    analyzer.clear_cache()
+    third = analyzer.analyze(review)
+    assert third['prediction'] == second['prediction'], "Prediction changed after clear_cache"
+    
+    print("\nTest passed: Cached analysis works correctly")
+    return True
+
+
+def test_deep_health_check_runs_model():
+    """Test repeated deep health checks still run DistilBERT"""
+    import Integration.api_interface as api_interface
+    from Integration.hybrid_analyzer import HybridAnalyzer
+    
+    print("\n" + "="*70)
+    print("TEST 11: Deep Health Check")
+    print("="*70)
+    
+    # Share the already-loaded analyzer instead of loading a second model
+    api_interface._ANALYZER_SINGLETON = analyzer
+    api = api_interface.ReviewAnalyzer()
+    
+    forward_calls = []
+    original_forward = HybridAnalyzer._forward
+    
+    def counting_forward(self, *args, **kwargs):
+        forward_calls.append(1)
+        return original_forward(self, *args, **kwargs)
+    
+    HybridAnalyzer._forward = counting_forward
+    try:
+        first = api.deep_health_check()
+        second = api.deep_health_check()
+    finally:
+        HybridAnalyzer._forward = original_forward
+    
+    assert first['status'] == 'healthy' and second['status'] == 'healthy', \
+        f"Deep health check failed: {first}, {second}"
+    assert len(forward_calls) == 2, \
+        f"Expected 2 forward passes, got {len(forward_calls)} (cached result served)"
+    
+    print("\nTest passed: Every deep health check runs the model")
+    return True
+
+
+def test_health_check_device():
+    """Test health_check reports the device of the active backend"""
+    import Integration.api_interface as api_interface
+    
+    print("\n" + "="*70)
+    print("TEST 12: Health Check Device")
+    print("="*70)
+    
+    api_interface._ANALYZER_SINGLETON = analyzer
+    health = api_interface.ReviewAnalyzer().health_check()
+    
+    print(f"\nBackend: {analyzer.backend}, device: {health['device']}")
+    
+    assert health['status'] == 'healthy', f"Health check failed: {health}"
+    assert health['device'] == analyzer.device_name, \
+        f"Expected {analyzer.device_name!r}, got {health['device']!r}"
+    if analyzer.backend != "torch":
+        assert "ONNX Runtime" in health['device'] or "TensorRT" in health['device'] \
+            or "OpenVINO" in health['device'], \
+            f"Non-torch backend reported a bare torch device: {health['device']!r}"
+    
+    print("\nTest passed: Health check reports the backend's device")
+    return True
+
+
 def test_edge_cases():
     """Test edge cases"""
     print("\n" + "="*70)
@@ -254,7 +374,11 @@ if __name__ == "__main__":
         test_distilbert_prediction,
         test_agreement_check,
         test_format_output,
-        test_edge_cases
+        test_edge_cases,
+        test_batch_prediction,
+        test_cached_analysis,
+        test_deep_health_check_runs_model,
+        test_health_check_device
     ]
     
     passed = 0
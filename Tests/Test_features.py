@@ -101,6 +101,20 @@ def test_normal_first_person():
     print(f" Normal first-person usage detected ({result['first_person_ratio']:.2%})")
 
 
+def test_first_person_with_punctuation():
+    """Pronouns followed by punctuation should still be counted"""
+    xai = FakeReviewXAI()
+    result = xai.extract_all_features("Works for me! Fits my, desk.")
+    
+    assert result['first_person_count'] == 2, f"Expected 2 pronouns, got {result['first_person_count']}"
+    assert result['word_count'] == 6, f"Expected 6 words, got {result['word_count']}"
+    
+    # Stand-alone punctuation is not a word (a whitespace split would count 5)
+    result = xai.extract_all_features("Great - really great !")
+    assert result['word_count'] == 3, f"Expected 3 words, got {result['word_count']}"
+    print(" Punctuation-attached pronouns counted")
+
+
 # ============================================================================
 # TIER 2 FEATURE TESTS
 # ============================================================================
@@ -205,6 +219,82 @@ def test_tfidf_similarity():
     print(f"TF-IDF similarity extracted: {result['tfidf_similarity']:.2f}")
 
 
+def test_set_pos_tagger_clears_cache():
+    """Swapping the POS tagger should not serve features from the old tagger"""
+    from XAI_engine.feature_extractors import set_pos_tagger
+    
+    class NounTagger:
+        """Tags every token as a noun"""
+        def tag(self, tokens):
+            return [(token, 'NN') for token in tokens]
+        
+        def tag_sents(self, sentences):
+            return [self.tag(tokens) for tokens in sentences]
+    
+    xai = FakeReviewXAI()
+    review = "Amazing wonderful perfect great product"
+    before = xai.extract_all_features(review)['adj_noun_ratio']  # now cached
+    
+    previous = set_pos_tagger(NounTagger())
+    try:
+        swapped = xai.extract_all_features(review)['adj_noun_ratio']
+    finally:
+        set_pos_tagger(previous)
+    restored = xai.extract_all_features(review)['adj_noun_ratio']
+    
+    assert before > 2.5, f"Expected ratio > 2.5 with default tagger, got {before}"
+    assert swapped == 0.0, f"Expected 0.0 with noun-only tagger, got {swapped}"
+    assert restored == before, f"Expected {before} after restoring tagger, got {restored}"
+    print(f"Tagger swap applied (ratio {before:.2f} -> {swapped:.2f} -> {restored:.2f})")
+
+
+def test_features_frame():
+    """Corpus DataFrame should match per-review features for lists and Series"""
+    import pandas as pd
+    from XAI_engine.feature_extractors import extract_all_features, extract_features_frame
+    
+    reviews = ["AMAZING!!! BEST EVER!!!", "Bought this laptop for school, battery lasts 6 hours."]
+    
+    frame = extract_features_frame(reviews)
+    assert list(frame.index) == [0, 1], f"Expected default index, got {list(frame.index)}"
+    for row, review in zip(frame.to_dict('records'), reviews):
+        assert row == extract_all_features(review), f"Frame row mismatch for: {review}"
+    
+    series = pd.Series(reviews, index=['r1', 'r2'])
+    frame = extract_features_frame(series)
+    assert list(frame.index) == ['r1', 'r2'], f"Series index not kept: {list(frame.index)}"
+    assert frame.loc['r1', 'word_count'] == extract_all_features(reviews[0])['word_count'], \
+        "Series row mismatch"
+    
+    print("Feature frame built for list and Series input")
+
+
+def test_tfidf_similarity_matches_sklearn():
+    """Precomputed TF-IDF similarity should match a full sklearn refit"""
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+    from XAI_engine.feature_extractors import GENERIC_REVIEWS
+    
+    xai = FakeReviewXAI()
+    reviews = [
+        "Great product works well good quality",
+        "This product is amazing. I love it!",
+        "Bought this laptop for school, battery lasts 6 hours.",
+        "the and of"
+    ]
+    
+    for review in reviews:
+        vectorizer = TfidfVectorizer(stop_words='english')
+        tfidf_matrix = vectorizer.fit_transform(list(GENERIC_REVIEWS) + [review])
+        expected = cosine_similarity(tfidf_matrix[-1:], tfidf_matrix[:-1]).max()
+        
+        result = xai.extract_all_features(review)
+        assert abs(result['tfidf_similarity'] - expected) < 1e-9, \
+            f"Expected {expected:.4f}, got {result['tfidf_similarity']:.4f} for: {review}"
+    
+    print("TF-IDF similarity matches sklearn reference")
+
+
 def test_all_tiers_extracted():
     """Should extract all features from all tiers"""
     xai = FakeReviewXAI()
@@ -247,6 +337,7 @@ if __name__ == "__main__":
         test_balanced_adjectives,
         test_excessive_first_person,
         test_normal_first_person,
+        test_first_person_with_punctuation,
         # Tier 2
         test_spam_keywords,
         test_excessive_caps,
@@ -258,6 +349,9 @@ if __name__ == "__main__":
         test_bigram_repetitiveness,
         test_common_fake_ngrams,
         test_tfidf_similarity,
+        test_tfidf_similarity_matches_sklearn,
+        test_features_frame,
+        test_set_pos_tagger_clears_cache,
         test_all_tiers_extracted
     ]
     
@@ -6,23 +6,216 @@ Tier 1: Essential Features (sentiment, word count, adj/noun ratio, first-person)
 Tier 2: Important Features (spam keywords, caps, punctuation, redundancy)
 """
 
+import math
 import re
+from collections import Counter
+from functools import cached_property, lru_cache
 from nltk.tokenize import word_tokenize
-from nltk import pos_tag
+from nltk.tag.perceptron import PerceptronTagger
 from nltk.sentiment.vader import SentimentIntensityAnalyzer
 import textstat
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 from nltk.util import ngrams
 
-# Download NLTK data (run once):
+# Download NLTK data (only what is missing - a warm cache skips the
+# download check entirely):
 import nltk
-nltk.download('punkt')
-nltk.download('averaged_perceptron_tagger')
-nltk.download('vader_lexicon')
 
-# Initialize VADER
-sentiment_analyzer = SentimentIntensityAnalyzer()
+_NLTK_RESOURCES = (
+    ('punkt', 'tokenizers/punkt'),
+    ('averaged_perceptron_tagger', 'taggers/averaged_perceptron_tagger'),
+    ('vader_lexicon', 'sentiment/vader_lexicon')
+)
+
+for _package, _path in _NLTK_RESOURCES:
+    try:
+        nltk.data.find(_path)
+    except LookupError:
+        nltk.download(_package, quiet=True)
+
+# VADER and the POS tagger are created on first use (then kept), so
+# importing the engine - e.g. just to read THRESHOLDS - doesn't pay for
+# loading the lexicon / pickled tagger model
+sentiment_analyzer = None
+pos_tagger = None
+
+
+def _get_sentiment_analyzer():
+    """Shared VADER analyzer, created on first call."""
+    global sentiment_analyzer
+    if sentiment_analyzer is None:
+        sentiment_analyzer = SentimentIntensityAnalyzer()
+    return sentiment_analyzer
+
+
+def _get_pos_tagger():
+    """
+    Shared POS tagger, created on first call (nltk.pos_tag would reload the
+    pickled model on every call).
+    """
+    global pos_tagger
+    if pos_tagger is None:
+        pos_tagger = PerceptronTagger()
+    return pos_tagger
+
+
+def set_pos_tagger(tagger):
+    """
+    Replace the POS tagger used for the adjective/noun ratio.
+    
+    Any object with NLTK's tagger interface works - tag(tokens) and
+    tag_sents(list_of_token_lists) returning Penn Treebank tags - e.g. a
+    wrapper around a quantized ONNX tagging model.
+    
+    Passing None goes back to the default NLTK PerceptronTagger.
+    
+    Returns:
+        The previous tagger (so it can be restored; None if the default
+        tagger had not been loaded yet)
+    """
+    global pos_tagger
+    previous, pos_tagger = pos_tagger, tagger
+    # Cached features were computed with the old tagger's POS tags
+    extract_all_features_cached.cache_clear()
+    return previous
+
+
+# Lexical words: one compiled scan, punctuation never sticks to a word
+# ("me!" -> "me") and contractions stay whole ("it's")
+_WORD_RE = re.compile(r"[\w']+")
+
+# Repeated punctuation: group 1 = !!, group 2 = ??, group 3 = ...
+_PUNCT_RE = re.compile(r'(!{2,})|(\?{2,})|(\.{3,})')
+
+# First-person pronouns (frozenset: O(1) membership, built once)
+FIRST_PERSON_PRONOUNS = frozenset([
+    'i', 'me', 'my', 'mine', 'myself', 'we', 'us', 'our', 'ours', 'ourselves'
+])
+
+
+# Spam/promotional keywords by category (Tier 2)
+SPAM_KEYWORDS = {
+    'extreme_positive': ['amazing', 'perfect', 'best ever', 'incredible', 'outstanding', 'flawless'],
+    'extreme_negative': ['worst', 'terrible', 'horrible', 'awful', 'disgusting', 'pathetic'],
+    'promotional': ['buy now', 'must have', 'life changing', 'miracle', 'highly recommend']
+}
+
+# Flattened keywords and their categories as parallel tuples - index order
+# matches SPAM_KEYWORDS
+_SPAM_WORDS = tuple(
+    keyword for keywords in SPAM_KEYWORDS.values() for keyword in keywords
+)
+_SPAM_CATEGORIES = tuple(
+    category for category, keywords in SPAM_KEYWORDS.items() for _ in keywords
+)
+
+
+def _build_spam_automaton():
+    """
+    Build an Aho-Corasick automaton over all spam keywords, or return None
+    if pyahocorasick is not installed (plain substring checks are used then).
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for index, keyword in enumerate(_SPAM_WORDS):
+        automaton.add_word(keyword, index)
+    automaton.make_automaton()
+    return automaton
+
+
+_spam_automaton = _build_spam_automaton()
+
+# Common fake n-grams (expand based on data analysis)
+FAKE_NGRAMS = frozenset([('this', 'is'), ('i', 'love'), ('great', 'product'), ('best', 'ever')])
+
+# Number of distinct texts whose full feature dicts are cached
+FEATURE_CACHE_SIZE = 4096
+
+# Number of distinct texts whose readability scores are cached (Tier 3)
+READABILITY_CACHE_SIZE = 8192
+
+# Generic review templates for TF-IDF similarity (Tier 3)
+GENERIC_REVIEWS = (
+    "This product is amazing. I love it so much. Best purchase ever.",
+    "Great quality and fast shipping. Highly recommend.",
+    "Perfect for my needs. Will buy again."
+)
+
+# Same tokenization/stop words as TfidfVectorizer(stop_words='english')
+_tfidf_analyzer = TfidfVectorizer(stop_words='english').build_analyzer()
+_generic_term_counts = [Counter(_tfidf_analyzer(doc)) for doc in GENERIC_REVIEWS]
+_generic_doc_freq = Counter(term for counts in _generic_term_counts for term in counts)
+
+
+# ============================================================================
+# SHARED TOKENIZATION
+# ============================================================================
+
+class ReviewContext:
+    """
+    One review plus its tokenizations, each computed lazily and at most once.
+    
+    extract_all_features() builds one context and hands it to every
+    extractor, so the review is split, lowercased, tokenized and POS-tagged
+    once instead of once per feature. Every extractor also still accepts a
+    plain string.
+    """
+    
+    def __init__(self, review_text, pos_tags=None):
+        self.text = review_text
+        if pos_tags is not None:
+            self.pos_tags = pos_tags  # pre-computed (batch tagging)
+    
+    @cached_property
+    def lower(self):
+        return self.text.lower()
+    
+    @cached_property
+    def words(self):
+        """Whitespace-split words (original case)"""
+        return self.text.split()
+    
+    @cached_property
+    def lower_words(self):
+        """Lexical words (lowercase, punctuation stripped)"""
+        return _WORD_RE.findall(self.lower)
+    
+    @cached_property
+    def lower_split_words(self):
+        """Whitespace-split words (lowercase, punctuation kept)"""
+        return self.lower.split()
+    
+    @cached_property
+    def tokens(self):
+        """NLTK word tokens (original case)"""
+        return word_tokenize(self.text)
+    
+    @cached_property
+    def lower_tokens(self):
+        """NLTK word tokens (lowercase)"""
+        return [token.lower() for token in self.tokens]
+    
+    @cached_property
+    def bigrams(self):
+        """Adjacent pairs of self.lower_tokens"""
+        tokens = self.lower_tokens
+        return list(zip(tokens, tokens[1:]))
+    
+    @cached_property
+    def pos_tags(self):
+        """[(token, tag), ...] for self.tokens"""
+        return _get_pos_tagger().tag(self.tokens)
+
+
+def _as_context(review_text):
+    """Wrap a string in a ReviewContext (contexts are passed through)."""
+    if isinstance(review_text, ReviewContext):
+        return review_text
+    return ReviewContext(review_text)
 
 
 # ============================================================================
@@ -36,8 +229,7 @@ def extract_sentiment(review_text):
     
     Threshold: > 0.85 or < -0.85 is suspicious
     """
-    scores = sentiment_analyzer.polarity_scores(review_text)
-    return scores['compound']
+    return _get_sentiment_analyzer().polarity_scores(_as_context(review_text).text)['compound']
 
 
 def extract_word_count(review_text):
@@ -46,7 +238,7 @@ def extract_word_count(review_text):
     
     Threshold: < 15 words (too short) or > 200 words (too long)
     """
-    return len(review_text.split())
+    return len(_as_context(review_text).lower_words)
 
 
 def extract_adjective_noun_ratio(review_text):
@@ -57,8 +249,7 @@ def extract_adjective_noun_ratio(review_text):
     Threshold: > 2.5 is suspicious
     Returns: {'ratio': float, 'adjectives': int, 'nouns': int}
     """
-    tokens = word_tokenize(review_text)
-    pos_tags = pos_tag(tokens)
+    pos_tags = _as_context(review_text).pos_tags
     
     # Count adjectives (JJ, JJR, JJS)
     adjectives = sum(1 for _, pos in pos_tags if pos.startswith('JJ'))
@@ -83,11 +274,10 @@ def extract_first_person_ratio(review_text):
     Threshold: > 0.15 (15% of words) is suspicious
     Returns: {'ratio': float, 'count': int, 'total_words': int}
     """
-    first_person = ['i', 'me', 'my', 'mine', 'myself', 'we', 'us', 'our', 'ours', 'ourselves']
-    
-    words = review_text.lower().split()
+    words = _as_context(review_text).lower_words
     total = len(words)
-    count = sum(1 for word in words if word in first_person)
+    # map() over a frozenset membership test keeps the loop in C
+    count = sum(map(FIRST_PERSON_PRONOUNS.__contains__, words))
     
     return {
         'ratio': count / max(total, 1),
@@ -106,19 +296,18 @@ def detect_spam_keywords(review_text):
     Threshold: >= 3 keywords is suspicious
     Returns: {'found': list, 'count': int}
     """
-    spam_keywords = {
-        'extreme_positive': ['amazing', 'perfect', 'best ever', 'incredible', 'outstanding', 'flawless'],
-        'extreme_negative': ['worst', 'terrible', 'horrible', 'awful', 'disgusting', 'pathetic'],
-        'promotional': ['buy now', 'must have', 'life changing', 'miracle', 'highly recommend']
-    }
+    review_lower = _as_context(review_text).lower
     
-    review_lower = review_text.lower()
-    found = []
+    if _spam_automaton is not None:
+        # One linear pass for all keywords; each keyword counts once
+        matched = sorted({index for _, index in _spam_automaton.iter(review_lower)})
+    else:
+        matched = [i for i, keyword in enumerate(_SPAM_WORDS) if keyword in review_lower]
     
-    for category, keywords in spam_keywords.items():
-        for keyword in keywords:
-            if keyword in review_lower:
-                found.append({'keyword': keyword, 'category': category})
+    found = [
+        {'keyword': _SPAM_WORDS[i], 'category': _SPAM_CATEGORIES[i]}
+        for i in matched
+    ]
     
     return {'found': found, 'count': len(found)}
 
@@ -129,8 +318,11 @@ def detect_excessive_caps(review_text):
     Threshold: > 0.20 (20% of words) is suspicious
     Returns: {'ratio': float, 'count': int, 'words': list}
     """
-    words = [word for word in review_text.split() if word.isalpha()]
-    caps_words = [word for word in words if word.isupper() and len(word) > 1]
+    # filter(str.isalpha) runs the alphabetic check without a Python-level loop
+    words = list(filter(str.isalpha, _as_context(review_text).words))
+    # Same C-level filter for the upper-case check; only the (few) caps
+    # words reach the Python-level length test
+    caps_words = [word for word in filter(str.isupper, words) if len(word) > 1]
     
     return {
         'ratio': len(caps_words) / max(len(words), 1),
@@ -146,9 +338,11 @@ def detect_excessive_punctuation(review_text):
     Threshold: >= 3 patterns is suspicious
     Returns: {'exclamations': int, 'questions': int, 'ellipses': int, 'total': int}
     """
-    exclamations = len(re.findall(r'!{2,}', review_text))
-    questions = len(re.findall(r'\?{2,}', review_text))
-    ellipses = len(re.findall(r'\.{3,}', review_text))
+    # One scan for all three patterns; the matching group tells which one
+    counts = [0, 0, 0, 0]  # indexed by group number
+    for match in _PUNCT_RE.finditer(_as_context(review_text).text):
+        counts[match.lastindex] += 1
+    _, exclamations, questions, ellipses = counts
     
     return {
         'exclamations': exclamations,
@@ -165,7 +359,8 @@ def calculate_text_redundancy(review_text):
     Threshold: < 0.60 uniqueness ratio is suspicious
     Returns: {'uniqueness_ratio': float, 'unique_words': int, 'total_words': int}
     """
-    words = review_text.lower().split()
+    # Whitespace split, as UNIQUENESS_RATIO_MIN was tuned on
+    words = _as_context(review_text).lower_split_words
     unique_words = set(words)
     
     return {
@@ -185,11 +380,22 @@ def extract_readability_score(review_text):
     
     Returns: {'flesch_score': float, 'dale_chall_score': float}
     """
-    flesch = textstat.flesch_reading_ease(review_text)
-    dale_chall = textstat.dale_chall_readability_score(review_text)
+    flesch, dale_chall = _readability_scores(_as_context(review_text).text)
     return {'flesch_score': flesch, 'dale_chall_score': dale_chall}
 
 
+@lru_cache(maxsize=READABILITY_CACHE_SIZE)
+def _readability_scores(review_text):
+    """
+    Cached (flesch, dale_chall) for a text. Syllable counting dominates
+    textstat's cost and the result depends only on the text.
+    """
+    return (
+        textstat.flesch_reading_ease(review_text),
+        textstat.dale_chall_readability_score(review_text)
+    )
+
+
 def extract_ngram_features(review_text, n=2):
     """
     Analyze n-grams for repetitive or spammy patterns.
@@ -197,13 +403,11 @@ def extract_ngram_features(review_text, n=2):
     
     Returns: {'bigram_repetitiveness': float, 'common_fake_ngrams': int}
     """
-    tokens = word_tokenize(review_text.lower())
-    bigrams = list(ngrams(tokens, n))
-    
-    # Define common fake n-grams (expand based on data analysis)
-    fake_ngrams = [('this', 'is'), ('i', 'love'), ('great', 'product'), ('best', 'ever')]
+    # Same word_tokenize pass as POS tagging, lowercased per token
+    ctx = _as_context(review_text)
+    bigrams = ctx.bigrams if n == 2 else list(ngrams(ctx.lower_tokens, n))
     
-    common_count = sum(1 for bg in bigrams if bg in fake_ngrams)
+    common_count = sum(map(FAKE_NGRAMS.__contains__, bigrams))
     repetitiveness = len(set(bigrams)) / len(bigrams) if bigrams else 0
     
     return {'bigram_repetitiveness': repetitiveness, 'common_fake_ngrams': common_count}
@@ -214,20 +418,34 @@ def extract_semantic_similarity(review_text):
     Use TF-IDF to measure similarity to generic review templates.
     High similarity might indicate fake.
     
+    Gives the same result as fitting TfidfVectorizer(stop_words='english')
+    on GENERIC_REVIEWS + [review_text], but only the review is analyzed per
+    call - the templates' term counts are precomputed at import.
+    
     Returns: {'tfidf_similarity': float}
     """
-    # Simple TF-IDF similarity to a "generic" review
-    generic_reviews = [
-        "This product is amazing. I love it so much. Best purchase ever.",
-        "Great quality and fast shipping. Highly recommend.",
-        "Perfect for my needs. Will buy again."
-    ]
+    review_counts = Counter(_tfidf_analyzer(_as_context(review_text).text))
+    n_docs = len(GENERIC_REVIEWS) + 1
+    
+    def idf(term):
+        # Smoothed IDF as in sklearn; the review itself counts as a document
+        doc_freq = _generic_doc_freq[term] + (term in review_counts)
+        return math.log((1 + n_docs) / (1 + doc_freq)) + 1
     
-    vectorizer = TfidfVectorizer(stop_words='english')
-    tfidf_matrix = vectorizer.fit_transform(generic_reviews + [review_text])
+    review_weights = {term: count * idf(term) for term, count in review_counts.items()}
+    review_norm = math.sqrt(sum(w * w for w in review_weights.values()))
     
-    similarities = cosine_similarity(tfidf_matrix[-1:], tfidf_matrix[:-1])
-    max_sim = similarities.max()
+    if review_norm == 0:
+        # Nothing left after stop-word removal
+        return {'tfidf_similarity': 0.0}
+    
+    max_sim = 0.0
+    for generic_counts in _generic_term_counts:
+        generic_weights = {term: count * idf(term) for term, count in generic_counts.items()}
+        generic_norm = math.sqrt(sum(w * w for w in generic_weights.values()))
+        
+        dot = sum(w * review_weights.get(term, 0.0) for term, w in generic_weights.items())
+        max_sim = max(max_sim, dot / (generic_norm * review_norm))
     
     return {'tfidf_similarity': max_sim}
 
@@ -240,57 +458,115 @@ def extract_all_features(review_text, tier=3):
     """
     Extract all features based on tier level.
     
+    The review is wrapped in a single ReviewContext so every extractor
+    shares one set of tokenizations.
+    
     Args:
-        review_text: The review to analyze
+        review_text: The review to analyze (str or ReviewContext)
         tier: 1 (essential only), 2 (essential + important)
     
     Returns:
         Dictionary with all extracted features
     """
+    ctx = _as_context(review_text)
     features = {}
     
     # TIER 1: Always extract these
     
-    features['sentiment'] = extract_sentiment(review_text)
-    features['word_count'] = extract_word_count(review_text)
+    features['sentiment'] = extract_sentiment(ctx)
+    features['word_count'] = extract_word_count(ctx)
     
-    adj_noun = extract_adjective_noun_ratio(review_text)
+    adj_noun = extract_adjective_noun_ratio(ctx)
     features['adj_noun_ratio'] = adj_noun['ratio']
     features['adjective_count'] = adj_noun['adjectives']
     features['noun_count'] = adj_noun['nouns']
     
-    first_person = extract_first_person_ratio(review_text)
+    first_person = extract_first_person_ratio(ctx)
     features['first_person_ratio'] = first_person['ratio']
     features['first_person_count'] = first_person['count']
     
     # TIER 2: Add if tier >= 2
     if tier >= 2:     
-        spam = detect_spam_keywords(review_text)
+        spam = detect_spam_keywords(ctx)
         features['spam_keyword_count'] = spam['count']  
          
-        caps = detect_excessive_caps(review_text)
+        caps = detect_excessive_caps(ctx)
         features['caps_ratio'] = caps['ratio']
         
-        punct = detect_excessive_punctuation(review_text)
+        punct = detect_excessive_punctuation(ctx)
         features['excessive_punct_count'] = punct['total']
         
-        redundancy = calculate_text_redundancy(review_text)
+        redundancy = calculate_text_redundancy(ctx)
         features['uniqueness_ratio'] = redundancy['uniqueness_ratio']
     
     # TIER 3: Advanced features if tier >= 3
     if tier >= 3:
-        readability = extract_readability_score(review_text)
+        readability = extract_readability_score(ctx)
         features['flesch_score'] = readability['flesch_score']
         features['dale_chall_score'] = readability['dale_chall_score']
         
-        ngram_feat = extract_ngram_features(review_text)
+        ngram_feat = extract_ngram_features(ctx)
         features['bigram_repetitiveness'] = ngram_feat['bigram_repetitiveness']
         features['common_fake_ngrams'] = ngram_feat['common_fake_ngrams']
         
-        semantic = extract_semantic_similarity(review_text)
+        semantic = extract_semantic_similarity(ctx)
         features['tfidf_similarity'] = semantic['tfidf_similarity']
     
     return features
+
+
+@lru_cache(maxsize=FEATURE_CACHE_SIZE)
+def extract_all_features_cached(review_text, tier=3):
+    """
+    extract_all_features() computed once per distinct (text, tier).
+    
+    Features don't depend on thresholds, so duplicate reviews (spam
+    templates) skip VADER + POS + regex while explanations are still
+    generated from each engine's current thresholds. set_pos_tagger()
+    clears this cache. The returned dict is shared - copy before modifying.
+    """
+    return extract_all_features(review_text, tier=tier)
+
+
+def extract_all_features_batch(review_texts, tier=3):
+    """
+    Extract features for many reviews, POS-tagging them in one batch.
+    
+    Args:
+        review_texts: List of reviews to analyze
+        tier: Same as extract_all_features()
+    
+    Returns:
+        List of feature dictionaries, in input order
+    """
+    contexts = [ReviewContext(text) for text in review_texts]
+    tagged = _get_pos_tagger().tag_sents(ctx.tokens for ctx in contexts)
+    
+    for ctx, pos_tags in zip(contexts, tagged):
+        ctx.pos_tags = pos_tags
+    
+    return [extract_all_features(ctx, tier=tier) for ctx in contexts]
+
+
+def extract_features_frame(review_texts, tier=3):
+    """
+    Extract features for a corpus into a DataFrame (one row per review).
+    
+    Uses the batched POS tagging of extract_all_features_batch(), so
+    threshold tuning can work on columns instead of re-analyzing rows.
+    
+    Args:
+        review_texts: pandas Series or list of reviews
+        tier: Same as extract_all_features()
+    
+    Returns:
+        pandas.DataFrame with one column per feature; a Series keeps its index
+    """
+    import pandas as pd
+    
+    index = review_texts.index if isinstance(review_texts, pd.Series) else None
+    rows = extract_all_features_batch(list(review_texts), tier=tier)
+    return pd.DataFrame(rows, index=index)
         
 # ============================================================================
 # TEST CODE
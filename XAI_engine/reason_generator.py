@@ -2,6 +2,13 @@
 Reason Generator - Converts features into human-readable explanations
 """
 
+# Extreme sentiment messages, indexed by "is not positive"
+_SENTIMENT_MESSAGES = (
+    "Extremely positive sentiment (score: {:.2f}/1.0)",
+    " Extremely negative sentiment (score: {:.2f}/1.0)"
+)
+
+
 def generate_explanation(features, thresholds):
     """
     Generate human-readable explanation from extracted features.
@@ -21,18 +28,12 @@ def generate_explanation(features, thresholds):
     # 1. Sentiment Check
     sentiment = features['sentiment']
     if abs(sentiment) > thresholds['SENTIMENT_EXTREME']:
-        if sentiment > 0:
-            reasons.append({
-                'feature': 'Sentiment',
-                'message': f"Extremely positive sentiment (score: {sentiment:.2f}/1.0)",
-                'detail': "Genuine reviews typically show more balanced emotions"
-            })
-        else:
-            reasons.append({
-                'feature': 'Sentiment',
-                'message': f" Extremely negative sentiment (score: {sentiment:.2f}/1.0)",
-                'detail': "Genuine reviews typically show more balanced emotions"
-            })
+        # Only the message differs between the two directions
+        reasons.append({
+            'feature': 'Sentiment',
+            'message': _SENTIMENT_MESSAGES[sentiment <= 0].format(sentiment),
+            'detail': "Genuine reviews typically show more balanced emotions"
+        })
         confidence_score += 20
     
     # 2. Word Count Check
@@ -141,6 +142,10 @@ def generate_explanation(features, thresholds):
     
     # ===== DETERMINE VERDICT =====
     
+    # Every reason so far is a fired rule; the "Overall" note added below
+    # for genuine reviews is not a flag
+    flag_count = len(reasons)
+    
     if confidence_score >= 50:
         verdict = "LIKELY FAKE"
         confidence = min(confidence_score, 95)  # Cap at 95%
@@ -160,7 +165,7 @@ def generate_explanation(features, thresholds):
         'verdict': verdict,
         'confidence': confidence,
         'reasons': reasons,
-        'flag_count': len([r for r in reasons if '' in r['message']])
+        'flag_count': flag_count
     }
     
 
@@ -10,8 +10,9 @@ OOP Concepts Used:
 - Methods: Functions that belong to a class
 """
 
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-from .feature_extractors import extract_all_features
+from .feature_extractors import (
+    extract_all_features_batch, extract_all_features_cached, extract_word_count
+)
 from .reason_generator import generate_explanation, format_explanation_text
 from .config import THRESHOLDS
 
@@ -36,12 +37,15 @@ class FakeReviewXAI:
         print(result['verdict'])  # See the result
     """
     
+    # Fixed attribute set - no per-instance __dict__
+    __slots__ = ('thresholds', 'skip_tier3_short')
+    
     # ========================================================================
     # __init__ METHOD (CONSTRUCTOR)
     # ========================================================================
     # Think of it as "setting up" or "initializing" the machine
     
-    def __init__(self):
+    def __init__(self, skip_tier3_short=False):
         """
         Constructor - Sets up the XAI engine.
         
@@ -54,14 +58,26 @@ class FakeReviewXAI:
         Think of 'self' as "this specific machine"
         
         What happens here:
-        1. Creates a sentiment analyzer (VADER tool)
-        2. Loads threshold values from config
-        3. Stores them as INSTANCE VARIABLES (belong to this object)
+        1. Loads threshold values from config
+        2. Stores them as INSTANCE VARIABLES (belong to this object)
+        
+        Args:
+            skip_tier3_short (bool): Leave out the Tier 3 features
+                (readability, n-grams, TF-IDF) for reviews shorter than
+                WORD_COUNT_MIN - they are degenerate on a handful of words.
+                Only Tier 3 is skipped: sentiment, tokenization and POS
+                tagging still run, since the verdict needs the Tier 1-2
+                flags. Off by default so feature dicts match the full
+                analysis.
+        
+        (The VADER sentiment analyzer and POS tagger are created lazily by
+        feature_extractors on first use and shared by every instance)
         """
         
         # INSTANCE VARIABLE: This machine's thresholds
         # We load from config so they can be easily changed later
         self.thresholds = THRESHOLDS.copy()
+        self.skip_tier3_short = skip_tier3_short
         
         # ========================================================================
     # METHODS (FUNCTIONS THAT BELONG TO THE CLASS)
@@ -87,8 +103,20 @@ class FakeReviewXAI:
         Returns:
             dict: Dictionary with all extracted features
         """
-        # Use the enhanced extract_all_features with tier 3 (advanced features)
-        return extract_all_features(review_text, tier=3)
+        # Use the enhanced extract_all_features with tier 3 (advanced features);
+        # copy so callers can't modify the cached dict
+        return dict(extract_all_features_cached(review_text, self._tier_for(review_text)))
+    
+    def _tier_for(self, review_text):
+        """
+        Feature tier for a review: 2 for short reviews when skip_tier3_short
+        is on, 3 otherwise.
+        """
+        # extract_word_count is a single regex pass, no NLTK tokenization
+        if (self.skip_tier3_short
+                and extract_word_count(review_text) < self.thresholds['WORD_COUNT_MIN']):
+            return 2
+        return 3
     
     def analyze_review(self, review_text):
         """
@@ -103,6 +131,48 @@ class FakeReviewXAI:
         # Extract all features
         features = self.extract_all_features(review_text)
         
+        return self._build_result(review_text, features)
+    
+    def analyze_reviews(self, review_texts):
+        """
+        Analyze many reviews at once (POS tagging is batched).
+        
+        Args:
+            review_texts (list): The reviews to analyze
+            
+        Returns:
+            list: One analyze_review()-style dict per review, in input order
+        """
+        review_texts = list(review_texts)
+        all_features = [None] * len(review_texts)
+        
+        # Same per-review tier choice as analyze_review(); each tier is
+        # POS-tagged as one batch
+        indices_by_tier = {}
+        for i, review_text in enumerate(review_texts):
+            indices_by_tier.setdefault(self._tier_for(review_text), []).append(i)
+        
+        for tier, indices in indices_by_tier.items():
+            tier_features = extract_all_features_batch([review_texts[i] for i in indices], tier=tier)
+            for i, features in zip(indices, tier_features):
+                all_features[i] = features
+        
+        return [
+            self._build_result(review_text, features)
+            for review_text, features in zip(review_texts, all_features)
+        ]
+    
+    def _build_result(self, review_text, features):
+        """
+        Generate the explanation for extracted features and package the result.
+        
+        Args:
+            review_text (str): The analyzed review
+            features (dict): Output of extract_all_features()
+            
+        Returns:
+            dict: Complete analysis with features, verdict, and explanation
+        """
         # Generate explanation using reason_generator
         explanation_data = generate_explanation(features, self.thresholds)
         